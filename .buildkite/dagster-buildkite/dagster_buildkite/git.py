@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import subprocess
@@ -5,11 +6,17 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Set
 
+# Both helpers are memoized because they are called repeatedly with the same rev during
+# pipeline generation (every skip predicate checks the HEAD commit message), and each call
+# otherwise pays a fork+exec for a value that cannot change mid-process.
 
+
+@functools.lru_cache(maxsize=None)
 def get_commit(rev):
     return subprocess.check_output(["git", "rev-parse", "--short", rev]).decode("utf-8").strip()
 
 
+@functools.lru_cache(maxsize=None)
 def get_commit_message(rev):
     return (
         subprocess.check_output(["git", "rev-list", "--format=%B", "--max-count=1", rev])
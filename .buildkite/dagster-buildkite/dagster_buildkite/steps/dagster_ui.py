@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 from typing import List
 
@@ -8,6 +9,7 @@ from dagster_buildkite.step_builder import CommandStepBuilder
 from dagster_buildkite.utils import CommandStep, is_feature_branch
 
 
+@functools.lru_cache(maxsize=None)
 def skip_if_no_dagster_ui_components_changes():
     if not is_feature_branch():
         return None
@@ -36,6 +38,7 @@ def build_dagster_ui_components_steps() -> List[CommandStep]:
     ]
 
 
+@functools.lru_cache(maxsize=None)
 def skip_if_no_dagster_ui_core_changes():
     if not is_feature_branch():
         return None
@@ -0,0 +1,109 @@
+import io
+import os
+import random
+import string
+
+import yaml
+
+os.environ.setdefault("BUILDKITE_BRANCH", "master")
+
+from dagster_buildkite.utils import _emit_yaml, buildkite_yaml_for_steps
+
+ADVERSARIAL_SCALARS = [
+    "",
+    " ",
+    "plain",
+    "a\tb",
+    "...",
+    "... trailing",
+    "---",
+    "--- trailing",
+    "x: y",
+    "#comment",
+    "-dash",
+    "a'b\"c",
+    "true",
+    "Yes",
+    "null",
+    "~",
+    "0x1f",
+    "1_000",
+    "1.5",
+    ".inf",
+    "2023-08-21",
+    "line\nbreak",
+    "trailing ",
+    "\ttab-lead",
+    "{}",
+    "[]",
+    "a\\b",
+    "%literal",
+    "= ",
+    "`tick",
+    "*star",
+    "&anchor",
+    "!tag",
+    "|block",
+    ">fold",
+    "?key",
+]
+
+
+def _round_trip(payload):
+    out = io.StringIO()
+    _emit_yaml(payload, out)
+    assert yaml.safe_load(out.getvalue()) == payload, out.getvalue()
+
+
+def test_emit_yaml_adversarial_scalars():
+    for scalar in ADVERSARIAL_SCALARS:
+        _round_trip({"k": scalar, "l": [scalar, {"n": scalar, "m": [scalar]}]})
+        _round_trip([scalar])
+
+
+def test_emit_yaml_non_string_scalars():
+    _round_trip({"a": True, "b": False, "c": None, "d": 7, "e": 1.5, "f": [True, None, -3, 2.25]})
+
+
+def test_emit_yaml_empty_containers():
+    _round_trip({"a": {}, "b": [], "c": [{}, [], {"d": {}}], "e": [[{}], [[]]]})
+
+
+def test_emit_yaml_fuzzed_scalars():
+    random.seed(0)
+    alphabet = string.printable[:95] + "\n\t"
+    for _ in range(2000):
+        scalar = "".join(random.choice(alphabet) for _ in range(random.randint(0, 12)))
+        _round_trip({"k": scalar, "l": [scalar, {"n": scalar}]})
+
+
+def test_buildkite_yaml_for_steps_matches_pyyaml():
+    steps = [
+        {
+            "commands": ["echo hi", "x=1 && y"],
+            "label": "x: test",
+            "key": "k",
+            "agents": {"queue": "q"},
+            "retry": {"automatic": [{"exit_status": -1, "limit": 2}]},
+            "timeout_in_minutes": 90,
+            "plugins": [{"docker#v3.7.0": {"image": "img", "env": ["A", "B"]}}],
+        },
+        "wait",
+        {"group": "grp", "key": "g", "steps": [{"commands": [], "label": "empty"}]},
+        {
+            "trigger": "t",
+            "label": "L",
+            "async": True,
+            "build": {"message": "hello world"},
+            "branches": "master",
+            "if": "build.state != 'canceled'",
+        },
+        {"block": "b", "prompt": None, "fields": []},
+    ]
+    fast = buildkite_yaml_for_steps(steps, custom_slack_channel="chan")
+    os.environ["DAGSTER_BUILDKITE_SAFE_YAML"] = "1"
+    try:
+        slow = buildkite_yaml_for_steps(steps, custom_slack_channel="chan")
+    finally:
+        del os.environ["DAGSTER_BUILDKITE_SAFE_YAML"]
+    assert yaml.safe_load(fast) == yaml.safe_load(slow)
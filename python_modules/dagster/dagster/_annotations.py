@@ -10,7 +10,13 @@ from dagster._core.decorator_utils import (
     get_decorator_target,
     is_resource_def,
 )
-from dagster._utils.warnings import deprecation_warning, experimental_warning, supersession_warning
+from dagster._utils.warnings import (
+    deprecation_warning,
+    emit_preformatted_deprecation_warning,
+    experimental_warning,
+    format_deprecation_warning_message,
+    supersession_warning,
+)
 
 # For the time being, `Annotatable` is set to `Any` even though it should be set to `Decoratable` to
 # avoid choking the type checker. Choking happens because of a niche scenario where
@@ -282,11 +288,15 @@ def deprecated(
         if emit_runtime_warning:
             stack_level = _get_warning_stacklevel(__obj)
             subject = subject or _get_subject(__obj)
-            warning_fn = lambda: deprecation_warning(
+            # format once at decoration time; the warning fires on every call of the
+            # decorated object and the message never changes
+            message = format_deprecation_warning_message(
                 subject,
                 breaking_version=breaking_version,
                 additional_warn_text=additional_warn_text,
-                stacklevel=stack_level,
+            )
+            warning_fn = lambda: emit_preformatted_deprecation_warning(
+                message, stacklevel=stack_level
             )
             return apply_pre_call_decorator(__obj, warning_fn)
         else:
@@ -7,6 +7,7 @@ from typing import (
     Generic,
     Literal,
     NamedTuple,
+    Sequence,
     TypeVar,
     Union,
 )
@@ -94,6 +95,17 @@ class EntitySubset(Generic[T_EntityKey]):
     def compute_union(self, other: Self) -> Self:
         return self._oper(other, operator.or_)
 
+    def compute_union_all(self, others: Sequence[Self]) -> Self:
+        """Computes the union of this subset and all others in a single pass, avoiding the
+        intermediate subset objects that chained compute_union calls would allocate.
+        """
+        value = self.get_internal_value()
+        for other in others:
+            value = value | other.get_internal_value()
+        return self.__class__(
+            self._asset_graph_view, key=self._key, value=_ValidatedEntitySubsetValue(value)
+        )
+
     def compute_intersection(self, other: Self) -> Self:
         return self._oper(other, operator.and_)
 
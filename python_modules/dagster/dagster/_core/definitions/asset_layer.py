@@ -36,6 +36,7 @@ class AssetLayer(NamedTuple):
         NodeHandle, Mapping[AssetKey, AbstractSet[str]]
     ]
     outer_node_names_by_asset_key: Mapping[AssetKey, str] = {}
+    node_output_handles_by_asset_key: Mapping[AssetKey, NodeOutputHandle] = {}
 
     @staticmethod
     def from_graph_and_assets_node_mapping(
@@ -54,6 +55,7 @@ class AssetLayer(NamedTuple):
         """
         asset_key_by_input: Dict[NodeInputHandle, AssetKey] = {}
         asset_keys_by_node_output_handle: Dict[NodeOutputHandle, AssetKey] = {}
+        node_output_handles_by_asset_key: Dict[AssetKey, NodeOutputHandle] = {}
         check_key_by_output: Dict[NodeOutputHandle, AssetCheckKey] = {}
 
         node_output_handles_by_asset_check_key: Mapping[AssetCheckKey, NodeOutputHandle] = {}
@@ -83,6 +85,7 @@ class AssetLayer(NamedTuple):
                 )
 
                 asset_keys_by_node_output_handle[node_output_handle] = asset_key
+                node_output_handles_by_asset_key[asset_key] = node_output_handle
 
                 destinations = full_node_def.resolve_output_to_destinations(
                     output_name, node_handle
@@ -130,6 +133,7 @@ class AssetLayer(NamedTuple):
             node_output_handles_by_asset_check_key=node_output_handles_by_asset_check_key,
             check_names_by_asset_key_by_node_handle=check_names_by_asset_key_by_node_handle,
             outer_node_names_by_asset_key=outer_node_names_by_asset_key,
+            node_output_handles_by_asset_key=node_output_handles_by_asset_key,
         )
 
     @property
@@ -143,13 +147,10 @@ class AssetLayer(NamedTuple):
         return self.asset_graph.has(asset_key)
 
     def node_output_handle_for_asset(self, asset_key: AssetKey) -> NodeOutputHandle:
-        matching_handles = [
-            handle
-            for handle, handle_asset_key in self.asset_keys_by_node_output_handle.items()
-            if handle_asset_key == asset_key
-        ]
-        check.invariant(len(matching_handles) == 1)
-        return matching_handles[0]
+        # O(1) via the inverse mapping built alongside asset_keys_by_node_output_handle
+        node_output_handle = self.node_output_handles_by_asset_key.get(asset_key)
+        check.invariant(node_output_handle is not None)
+        return check.not_none(node_output_handle)
 
     def assets_def_for_node(self, node_handle: NodeHandle) -> Optional["AssetsDefinition"]:
         return self.assets_defs_by_node_handle.get(node_handle)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional
 
 import pytz
@@ -254,8 +255,13 @@ class AutoMaterializeRule(ABC):
 
         return SkipOnRunInProgressRule()
 
+    @lru_cache(maxsize=None)
     def to_snapshot(self) -> "AutoMaterializeRuleSnapshot":
-        """Returns a serializable snapshot of this rule for historical evaluations."""
+        """Returns a serializable snapshot of this rule for historical evaluations.
+
+        Memoized because snapshots are requested repeatedly for the same (immutable) rule
+        instance over the course of an evaluation.
+        """
         from dagster._core.definitions.auto_materialize_rule_evaluation import (
             AutoMaterializeRuleSnapshot,
         )
@@ -1128,6 +1128,11 @@ class DiscardOnMaxMaterializationsExceededRule(
             AutomationResult,
         )
 
+        # nothing can exceed the limit if there are no candidates, so skip the per-partition
+        # sort and subset reconstruction entirely
+        if context.legacy_context.candidate_subset.is_empty:
+            return AutomationResult(context, context.get_empty_subset())
+
         # the set of asset partitions which exceed the limit
         rate_limited_asset_partitions = set(
             sorted(
@@ -177,20 +177,40 @@ class AutomationCondition(ABC, Generic[T_EntityKey]):
             AndAutomationCondition,
         )
 
-        # group AndAutomationConditions together
-        if isinstance(self, AndAutomationCondition):
-            return AndAutomationCondition(operands=[*self.operands, other])
-        return AndAutomationCondition(operands=[self, other])
+        # group AndAutomationConditions together, flattening either side so that chained
+        # expressions produce a single wide node rather than a nested chain. a labeled
+        # operand is kept intact, as flattening it would discard its label
+        self_operands = (
+            self.operands
+            if isinstance(self, AndAutomationCondition) and self.get_label() is None
+            else [self]
+        )
+        other_operands = (
+            other.operands
+            if isinstance(other, AndAutomationCondition) and other.get_label() is None
+            else [other]
+        )
+        return AndAutomationCondition(operands=[*self_operands, *other_operands])
 
     def __or__(
         self, other: "AutomationCondition[T_EntityKey]"
     ) -> "BuiltinAutomationCondition[T_EntityKey]":
         from dagster._core.definitions.declarative_automation.operators import OrAutomationCondition
 
-        # group OrAutomationConditions together
-        if isinstance(self, OrAutomationCondition):
-            return OrAutomationCondition(operands=[*self.operands, other])
-        return OrAutomationCondition(operands=[self, other])
+        # group OrAutomationConditions together, flattening either side so that chained
+        # expressions produce a single wide node rather than a nested chain. a labeled
+        # operand is kept intact, as flattening it would discard its label
+        self_operands = (
+            self.operands
+            if isinstance(self, OrAutomationCondition) and self.get_label() is None
+            else [self]
+        )
+        other_operands = (
+            other.operands
+            if isinstance(other, OrAutomationCondition) and other.get_label() is None
+            else [other]
+        )
+        return OrAutomationCondition(operands=[*self_operands, *other_operands])
 
     def __invert__(self) -> "BuiltinAutomationCondition[T_EntityKey]":
         from dagster._core.definitions.declarative_automation.operators import (
@@ -1,4 +1,5 @@
 import datetime
+import functools
 import inspect
 import logging
 from dataclasses import dataclass
@@ -103,10 +104,12 @@ class AutomationContext(Generic[T_EntityKey]):
             request_subsets_by_key=self.request_subsets_by_key,
             parent_context=self,
             _cursor=self._cursor,
+            # only thread the legacy context into subtrees that contain a legacy rule;
+            # building it involves several allocations per child otherwise done for nothing
             _legacy_context=self._legacy_context.for_child(
                 child_condition, condition_unqiue_id, candidate_subset
             )
-            if self._legacy_context
+            if self._legacy_context and child_condition.has_rule_condition
             else None,
             _root_log=self._root_log,
         )
@@ -116,7 +119,7 @@ class AutomationContext(Generic[T_EntityKey]):
             return await self.condition.evaluate(self)
         return self.condition.evaluate(self)
 
-    @property
+    @functools.cached_property
     def log(self) -> logging.Logger:
         """The logger for the current condition evaluation."""
         return self._root_log.getChild(self.condition.__class__.__name__)
@@ -130,9 +133,13 @@ class AutomationContext(Generic[T_EntityKey]):
         """The asset key over which this condition is being evaluated."""
         return self.candidate_subset.key
 
-    @property
+    @functools.cached_property
     def partitions_def(self) -> Optional[PartitionsDefinition]:
-        """The partitions definition for the asset being evaluated, if it exists."""
+        """The partitions definition for the asset being evaluated, if it exists.
+
+        Cached on the context, as conditions may consult this repeatedly within a single
+        evaluation and the asset graph cannot change mid-tick.
+        """
         if isinstance(self.key, AssetKey):
             return self.asset_graph.get(self.key).partitions_def
         else:
@@ -1,3 +1,4 @@
+import logging
 from typing import TYPE_CHECKING, Optional
 
 from dagster._core.definitions.asset_key import AssetKey
@@ -34,11 +35,16 @@ class RuleCondition(BuiltinAutomationCondition[AssetKey]):
         return self.rule.description
 
     def evaluate(self, context: "AutomationContext[AssetKey]") -> AutomationResult[AssetKey]:
-        context.log.debug(f"Evaluating rule: {self.rule.to_snapshot()}")
+        # only format the debug messages (and construct the rule snapshot) when debug
+        # logging is actually enabled
+        debug_enabled = context.log.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            context.log.debug(f"Evaluating rule: {self.rule.to_snapshot()}")
         # Allow for access to legacy context in legacy rule evaluation
         evaluation_result = self.rule.evaluate_for_asset(context)
-        context.log.debug(
-            f"Rule returned {evaluation_result.true_subset.size} partitions "
-            f"({evaluation_result.end_timestamp - evaluation_result.start_timestamp:.2f} seconds)"
-        )
+        if debug_enabled:
+            context.log.debug(
+                f"Rule returned {evaluation_result.true_subset.size} partitions "
+                f"({evaluation_result.end_timestamp - evaluation_result.start_timestamp:.2f} seconds)"
+            )
         return evaluation_result
@@ -13,6 +13,12 @@ from dagster._record import record
 from dagster._serdes.serdes import whitelist_for_serdes
 
 
+def _requires_cursor_in_tree(condition: AutomationCondition) -> bool:
+    return condition.requires_cursor or any(
+        _requires_cursor_in_tree(child) for child in condition.children
+    )
+
+
 @whitelist_for_serdes(storage_name="AndAssetCondition")
 @record
 class AndAutomationCondition(BuiltinAutomationCondition[T_EntityKey]):
@@ -47,6 +53,12 @@ class AndAutomationCondition(BuiltinAutomationCondition[T_EntityKey]):
             ).evaluate_async()
             child_results.append(child_result)
             true_subset = true_subset.compute_intersection(child_result.true_subset)
+            # once the subset is empty, no later child can add anything back; stop
+            # evaluating unless a remaining child needs to update its cursor state
+            if true_subset.is_empty and not any(
+                _requires_cursor_in_tree(c) for c in self.children[i + 1 :]
+            ):
+                break
         return AutomationResult(context, true_subset, child_results=child_results)
 
     def without(self, condition: AutomationCondition) -> "AndAutomationCondition":
@@ -88,8 +100,6 @@ class OrAutomationCondition(BuiltinAutomationCondition[T_EntityKey]):
     async def evaluate(
         self, context: AutomationContext[T_EntityKey]
     ) -> AutomationResult[T_EntityKey]:
-        true_subset = context.get_empty_subset()
-
         coroutines = [
             context.for_child_condition(
                 child_condition=child, child_index=i, candidate_subset=context.candidate_subset
@@ -98,8 +108,9 @@ class OrAutomationCondition(BuiltinAutomationCondition[T_EntityKey]):
         ]
 
         child_results = await asyncio.gather(*coroutines)
-        for child_result in child_results:
-            true_subset = true_subset.compute_union(child_result.true_subset)
+        true_subset = context.get_empty_subset().compute_union_all(
+            [child_result.true_subset for child_result in child_results]
+        )
 
         return AutomationResult(context, true_subset, child_results=child_results)
 
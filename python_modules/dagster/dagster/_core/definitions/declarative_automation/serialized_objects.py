@@ -1,7 +1,9 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
+    Dict,
     FrozenSet,
     Generic,
     Iterator,
@@ -108,15 +110,20 @@ class AutomationConditionEvaluation(Generic[T_EntityKey]):
     def key(self) -> T_EntityKey:
         return self.true_subset.key
 
+    @cached_property
+    def _child_evaluations_by_unique_id(
+        self,
+    ) -> Mapping[str, "AutomationConditionEvaluation"]:
+        return {
+            child_evaluation.condition_snapshot.unique_id: child_evaluation
+            for child_evaluation in self.child_evaluations
+        }
+
     def for_child(self, child_unique_id: str) -> Optional["AutomationConditionEvaluation"]:
         """Returns the evaluation of a given child condition by finding the child evaluation that
         has an identical hash to the given condition.
         """
-        for child_evaluation in self.child_evaluations:
-            if child_evaluation.condition_snapshot.unique_id == child_unique_id:
-                return child_evaluation
-
-        return None
+        return self._child_evaluations_by_unique_id.get(child_unique_id)
 
     def with_run_ids(self, run_ids: AbstractSet[str]) -> "AutomationConditionEvaluationWithRunIds":
         return AutomationConditionEvaluationWithRunIds(evaluation=self, run_ids=frozenset(run_ids))
@@ -195,21 +202,21 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
     ) -> "AutomationConditionCursor":
         """Serves as a temporary method to convert from old representation to the new representation."""
 
-        def _get_node_cursors(
+        def _collect_node_cursors(
             evaluation: AutomationConditionEvaluation,
+            node_cursors: Dict[str, AutomationConditionNodeCursor],
         ) -> Mapping[str, AutomationConditionNodeCursor]:
-            node_cursors = {
-                evaluation.condition_snapshot.unique_id: AutomationConditionNodeCursor(
-                    true_subset=evaluation.true_subset,
-                    candidate_subset=evaluation.candidate_subset,
-                    subsets_with_metadata=evaluation.subsets_with_metadata,
-                    extra_state=evaluation_state.extra_state_by_unique_id.get(
-                        evaluation.condition_snapshot.unique_id
-                    ),
-                )
-            }
+            # accumulator-passing traversal to avoid building and merging a dict per node
+            node_cursors[evaluation.condition_snapshot.unique_id] = AutomationConditionNodeCursor(
+                true_subset=evaluation.true_subset,
+                candidate_subset=evaluation.candidate_subset,
+                subsets_with_metadata=evaluation.subsets_with_metadata,
+                extra_state=evaluation_state.extra_state_by_unique_id.get(
+                    evaluation.condition_snapshot.unique_id
+                ),
+            )
             for child in evaluation.child_evaluations:
-                node_cursors.update(_get_node_cursors(child))
+                _collect_node_cursors(child, node_cursors)
 
             return node_cursors
 
@@ -217,7 +224,9 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
             previous_requested_subset=evaluation_state.previous_evaluation.true_subset,
             effective_timestamp=evaluation_state.previous_tick_evaluation_timestamp or 0,
             last_event_id=evaluation_state.max_storage_id,
-            node_cursors_by_unique_id=_get_node_cursors(evaluation_state.previous_evaluation),
+            node_cursors_by_unique_id=_collect_node_cursors(
+                evaluation_state.previous_evaluation, {}
+            ),
             result_value_hash="",
         )
 
@@ -225,17 +234,21 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
     def from_result(
         context: "AutomationContext", result: "AutomationResult", result_hash: str
     ) -> "AutomationConditionCursor":
-        def _gather_node_cursors(r: "AutomationResult"):
-            node_cursors = {r.condition_unique_id: r.node_cursor} if r.node_cursor else {}
+        def _gather_node_cursors(
+            r: "AutomationResult", node_cursors: Dict[str, AutomationConditionNodeCursor]
+        ) -> Mapping[str, AutomationConditionNodeCursor]:
+            # accumulator-passing traversal to avoid building and merging a dict per node
+            if r.node_cursor:
+                node_cursors[r.condition_unique_id] = r.node_cursor
             for rr in r.child_results:
-                node_cursors.update(_gather_node_cursors(rr))
+                _gather_node_cursors(rr, node_cursors)
             return node_cursors
 
         return AutomationConditionCursor(
             previous_requested_subset=result.true_subset.convert_to_serializable_subset(),
             effective_timestamp=context.evaluation_time.timestamp(),
             last_event_id=context.max_storage_id,
-            node_cursors_by_unique_id=_gather_node_cursors(result),
+            node_cursors_by_unique_id=_gather_node_cursors(result, {}),
             result_value_hash=result_hash,
         )
 
@@ -22,6 +22,8 @@ from dagster._utils.forked_pdb import ForkedPdb
 
 
 class AssetCheckExecutionContext:
+    __slots__ = ("_op_execution_context", "_step_execution_context")
+
     def __init__(self, op_execution_context: OpExecutionContext) -> None:
         self._op_execution_context = check.inst_param(
             op_execution_context, "op_execution_context", OpExecutionContext
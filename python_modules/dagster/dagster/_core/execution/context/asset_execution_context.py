@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import AbstractSet, Any, Iterator, Mapping, Optional, Sequence
 
 import dagster._check as check
@@ -49,17 +50,24 @@ ALTERNATE_EXPRESSIONS = {
     "get_tag": "context.run.tags.get(key)",
 }
 
-USE_OP_CONTEXT = [
-    "op_config",
-    "node_handle",
-    "op_handle",
-    "op",
-    "get_mapping_key",
-    "selected_output_names",
-]
+USE_OP_CONTEXT = frozenset(
+    [
+        "op_config",
+        "node_handle",
+        "op_handle",
+        "op",
+        "get_mapping_key",
+        "selected_output_names",
+    ]
+)
+
+# union of every attribute with a registered deprecation
+_ALL_DEPRECATED_METHODS = (
+    frozenset(ALTERNATE_METHODS) | frozenset(ALTERNATE_EXPRESSIONS) | USE_OP_CONTEXT
+)
 
 
-def _get_deprecation_kwargs(attr: str) -> Mapping[str, Any]:
+def _build_deprecation_kwargs(attr: str) -> Mapping[str, Any]:
     deprecation_kwargs = {"breaking_version": "a future release"}
     deprecation_kwargs["subject"] = f"AssetExecutionContext.{attr}"
 
@@ -82,12 +90,49 @@ def _get_deprecation_kwargs(attr: str) -> Mapping[str, Any]:
     return deprecation_kwargs
 
 
+# materialized once at import so each @deprecated decorator below resolves its kwargs with a
+# single dict hit instead of rebuilding the strings per attribute. the values are wrapped in
+# read-only proxies since a single mapping object is shared across decorator invocations
+_DEPRECATION_KWARGS: Mapping[str, Mapping[str, Any]] = {
+    attr: MappingProxyType(dict(_build_deprecation_kwargs(attr)))
+    for attr in _ALL_DEPRECATED_METHODS
+}
+
+
+def _get_deprecation_kwargs(attr: str) -> Mapping[str, Any]:
+    return _DEPRECATION_KWARGS.get(attr) or _build_deprecation_kwargs(attr)
+
+
 class AssetExecutionContext:
+    __slots__ = (
+        "_op_execution_context",
+        "_step_execution_context",
+        "_bound_partition_key_range_for_input",
+        "_bound_partition_key_for_input",
+        "_bound_partition_keys_for_input",
+        "_bound_partitions_time_window_for_input",
+    )
+
     def __init__(self, op_execution_context: OpExecutionContext) -> None:
-        self._op_execution_context = check.inst_param(
-            op_execution_context, "op_execution_context", OpExecutionContext
-        )
+        # constructed once per asset step; a bare isinstance avoids the check.inst_param
+        # call frame on this hot construction path
+        if not isinstance(op_execution_context, OpExecutionContext):
+            raise check.ParameterCheckError(
+                'Param "op_execution_context" is not a OpExecutionContext. Got'
+                f" {op_execution_context!r} which is type {type(op_execution_context)}."
+            )
+        self._op_execution_context = op_execution_context
         self._step_execution_context = self._op_execution_context._step_execution_context  # noqa: SLF001
+        # pre-bound references to the hottest partition delegates, so each wrapper call
+        # skips the attribute lookup and descriptor dispatch on the wrapped context
+        self._bound_partition_key_range_for_input = (
+            op_execution_context.asset_partition_key_range_for_input
+        )
+        self._bound_partition_key_for_input = op_execution_context.asset_partition_key_for_input
+        self._bound_partition_keys_for_input = op_execution_context.asset_partition_keys_for_input
+        self._bound_partitions_time_window_for_input = (
+            op_execution_context.asset_partitions_time_window_for_input
+        )
 
     @staticmethod
     def get() -> "AssetExecutionContext":
@@ -411,12 +456,12 @@ class AssetExecutionContext:
     @public
     @_copy_docs_from_op_execution_context
     def asset_partition_key_range_for_input(self, input_name: str) -> PartitionKeyRange:
-        return self.op_execution_context.asset_partition_key_range_for_input(input_name)
+        return self._bound_partition_key_range_for_input(input_name)
 
     @public
     @_copy_docs_from_op_execution_context
     def asset_partition_key_for_input(self, input_name: str) -> str:
-        return self.op_execution_context.asset_partition_key_for_input(input_name)
+        return self._bound_partition_key_for_input(input_name)
 
     @public
     @_copy_docs_from_op_execution_context
@@ -426,12 +471,12 @@ class AssetExecutionContext:
     @public
     @_copy_docs_from_op_execution_context
     def asset_partition_keys_for_input(self, input_name: str) -> Sequence[str]:
-        return self.op_execution_context.asset_partition_keys_for_input(input_name=input_name)
+        return self._bound_partition_keys_for_input(input_name=input_name)
 
     @public
     @_copy_docs_from_op_execution_context
     def asset_partitions_time_window_for_input(self, input_name: str = "result") -> TimeWindow:
-        return self.op_execution_context.asset_partitions_time_window_for_input(input_name)
+        return self._bound_partitions_time_window_for_input(input_name)
 
     #### Event log related
 
@@ -1,5 +1,19 @@
+import os
+import sys
 from abc import ABC, abstractmethod
-from typing import AbstractSet, Any, Dict, Iterator, List, Mapping, Optional, Sequence, cast
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Deque,
+    FrozenSet,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    cast,
+)
 
 import dagster._check as check
 from dagster._annotations import deprecated, experimental, public
@@ -20,7 +34,11 @@ from dagster._core.definitions.events import (
 )
 from dagster._core.definitions.job_definition import JobDefinition
 from dagster._core.definitions.op_definition import OpDefinition
-from dagster._core.definitions.partition import PartitionsDefinition
+from dagster._core.definitions.partition import (
+    CachingDynamicPartitionsLoader,
+    PartitionsDefinition,
+    PartitionsSubset,
+)
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.repository_definition.repository_definition import (
     RepositoryDefinition,
@@ -33,12 +51,113 @@ from dagster._core.execution.context.system import StepExecutionContext
 from dagster._core.instance import DagsterInstance
 from dagster._core.log_manager import DagsterLogManager
 from dagster._core.storage.dagster_run import DagsterRun
+from dagster._utils.cached_method import CACHED_METHOD_CACHE_FIELD, cached_method
 from dagster._utils.forked_pdb import ForkedPdb
 
+if TYPE_CHECKING:
+    from dagster._core.definitions.asset_layer import AssetLayer
+
+
+def _intern_partition_key(key: str) -> str:
+    """Intern partition keys at the context boundary so equal keys share storage; the same
+    short strings recur across assets, inputs, and steps.
+
+    sys.intern only accepts exact str, and str subclasses like MultiPartitionKey must be
+    passed through unchanged (callers rely on e.g. keys_by_dimension).
+    """
+    return sys.intern(key) if type(key) is str else key
+
+
+def _require_partitions_def(
+    asset_key: AssetKey, partitions_def: Optional[PartitionsDefinition]
+) -> PartitionsDefinition:
+    if partitions_def is None:
+        raise DagsterInvariantViolationError(
+            f"Attempting to access partitions def for asset {asset_key}, but it is not partitioned"
+        )
+    return partitions_def
+
+
+class _LazyPartitionKeySequence(Sequence[str]):
+    """Sequence[str] view over a partitions subset that defers materializing the full key
+    list until a caller actually needs it (len, indexing, comparison). Plain iteration
+    streams directly from the subset, so wide backfill ranges that are only iterated never
+    allocate the intermediate list.
+    """
+
+    __slots__ = ("_subset", "_keys")
+
+    def __init__(self, subset: PartitionsSubset):
+        self._subset = subset
+        self._keys: Optional[Sequence[str]] = None
+
+    def _materialized(self) -> Sequence[str]:
+        if self._keys is None:
+            self._keys = [_intern_partition_key(key) for key in self._subset.get_partition_keys()]
+        return self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        if self._keys is not None:
+            return iter(self._keys)
+        return iter(self._subset.get_partition_keys())
+
+    def __len__(self) -> int:
+        return len(self._materialized())
+
+    def __getitem__(self, index) -> Any:
+        return self._materialized()[index]
+
+    def __contains__(self, item: object) -> bool:
+        if self._keys is None and isinstance(item, str):
+            return item in self._subset
+        return item in self._materialized()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _LazyPartitionKeySequence):
+            return self._materialized() == other._materialized()
+        if isinstance(other, list):
+            return self._materialized() == other
+        if isinstance(other, tuple):
+            return tuple(self._materialized()) == other
+        if isinstance(other, Sequence):
+            return list(self._materialized()) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self._materialized()))
+
+
+# param validation on per-event context methods can be disabled for pipelines that emit
+# metadata at very high frequency, either with python -O or via the env var below
+_PERFORM_PARAM_CHECKS = __debug__ and not os.getenv("DAGSTER_CONTEXT_SKIP_PARAM_CHECKS")
+
+# shared empty results for the no-assets-def cases; immutable, so safe to hand out and
+# cheaper than allocating a fresh set per access
+_EMPTY_ASSET_KEYS: FrozenSet[AssetKey] = frozenset()
+_EMPTY_CHECK_KEYS: FrozenSet[AssetCheckKey] = frozenset()
+
+# type-keyed dispatch for log_event; an O(1) dict hit replaces an isinstance cascade on a
+# path that can run once per logged event. isinstance is kept as a fallback for subclasses.
+_USER_EVENT_FACTORIES: Mapping[type, Any] = {
+    AssetMaterialization: DagsterEvent.asset_materialization,
+    AssetObservation: DagsterEvent.asset_observation,
+    ExpectationResult: DagsterEvent.step_expectation_result,
+}
+
 
 class AbstractComputeExecutionContext(ABC):
     """Base class for op context implemented by OpExecutionContext and DagstermillExecutionContext."""
 
+    # no instance state of its own; without this, every subclass would carry a per-instance
+    # __dict__ regardless of its own __slots__ declaration
+    __slots__ = ()
+
     @abstractmethod
     def has_tag(self, key: str) -> bool:
         """Implement this method to check if a logging tag is set."""
@@ -106,22 +225,57 @@ class OpExecutionContext(AbstractComputeExecutionContext):
                 context.log.info("Hello, world!")
     """
 
-    __slots__ = ["_step_execution_context"]
+    __slots__ = (
+        "_step_execution_context",
+        "_pdb",
+        "_events",
+        "_asset_layer",
+        "_assets_def",
+        "_op",
+        "_op_description",
+        "_run_tags",
+        "_dynamic_partitions_loader",
+        CACHED_METHOD_CACHE_FIELD,
+    )
 
     def __init__(self, step_execution_context: StepExecutionContext):
-        self._step_execution_context = check.inst_param(
-            step_execution_context,
-            "step_execution_context",
-            StepExecutionContext,
-        )
+        # contexts are constructed once per step; a bare isinstance avoids the
+        # check.inst_param call frame on this hot construction path
+        if not isinstance(step_execution_context, StepExecutionContext):
+            raise check.ParameterCheckError(
+                'Param "step_execution_context" is not a StepExecutionContext. Got'
+                f" {step_execution_context!r} which is type {type(step_execution_context)}."
+            )
+        self._step_execution_context = step_execution_context
         self._pdb: Optional[ForkedPdb] = None
-        self._events: List[DagsterEvent] = []
-        self._output_metadata: Dict[str, Any] = {}
+        # lazily allocated in log_event; most ops never log a user event
+        self._events: Optional[Deque[DagsterEvent]] = None
+        # the asset layer, assets def and op node are immutable for the lifetime of the
+        # context; resolve them once so the many properties that route through them pay a
+        # single attribute load per access instead of a graph lookup
+        self._asset_layer: "AssetLayer" = step_execution_context.job_def.asset_layer
+        self._assets_def: Optional[AssetsDefinition] = self._asset_layer.assets_def_for_node(
+            step_execution_context.node_handle
+        )
+        self._op: Node = step_execution_context.job_def.get_node(step_execution_context.node_handle)
+        self._op_description: Optional[str] = None
+        self._run_tags: Optional[Mapping[str, str]] = None
+        self._dynamic_partitions_loader: Optional[CachingDynamicPartitionsLoader] = None
 
     @property
     def op_execution_context(self) -> "OpExecutionContext":
         return self
 
+    def _get_dynamic_partitions_loader(self) -> CachingDynamicPartitionsLoader:
+        """A per-step caching wrapper around the instance, so repeated partition-key
+        materializations fetch each dynamic partitions list at most once.
+        """
+        if self._dynamic_partitions_loader is None:
+            self._dynamic_partitions_loader = CachingDynamicPartitionsLoader(
+                self._step_execution_context.instance
+            )
+        return self._dynamic_partitions_loader
+
     @public
     @property
     def op_config(self) -> Any:
@@ -231,13 +385,13 @@ class OpExecutionContext(AbstractComputeExecutionContext):
         :meta private:
 
         """
-        return self._step_execution_context.job_def.get_node(self.node_handle)
+        return self._op
 
     @public
     @property
     def op_def(self) -> OpDefinition:
         """OpDefinition: The current op definition."""
-        return cast(OpDefinition, self.op.definition)
+        return cast(OpDefinition, self._op.definition)
 
     @public
     @property
@@ -291,7 +445,8 @@ class OpExecutionContext(AbstractComputeExecutionContext):
                 # running a backfill of the 2023-08-21 through 2023-08-25 partitions of this asset will log:
                 #   ["2023-08-21", "2023-08-22", "2023-08-23", "2023-08-24", "2023-08-25"]
         """
-        key_range = self.partition_key_range
+        step_context = self._step_execution_context
+        key_range = step_context.partition_key_range
         partitions_def = self.assets_def.partitions_def
         if partitions_def is None:
             raise DagsterInvariantViolationError(
@@ -300,7 +455,7 @@ class OpExecutionContext(AbstractComputeExecutionContext):
 
         return partitions_def.get_partition_keys_in_range(
             key_range,
-            dynamic_partitions_store=self.instance,
+            dynamic_partitions_store=self._get_dynamic_partitions_loader(),
         )
 
     @deprecated(breaking_version="2.0", additional_warn_text="Use `partition_key_range` instead.")
@@ -395,7 +550,11 @@ class OpExecutionContext(AbstractComputeExecutionContext):
     @property
     def run_tags(self) -> Mapping[str, str]:
         """Mapping[str, str]: The tags for the current run."""
-        return self.dagster_run.tags
+        # cached so repeated tag reads resolve in a single attribute load rather than
+        # re-traversing the step context and run
+        if self._run_tags is None:
+            self._run_tags = self.dagster_run.tags
+        return self._run_tags
 
     def has_events(self) -> bool:
         return bool(self._events)
@@ -405,9 +564,13 @@ class OpExecutionContext(AbstractComputeExecutionContext):
 
         If consume_events has not yet been called, this will yield all logged events since the beginning of the op's computation. If consume_events has been called, it will yield all events since the last time consume_events was called. Designed for internal use. Users should never need to invoke this method.
         """
+        # drain in place so the same deque is reused across consume cycles rather than
+        # allocating a replacement buffer per drain
         events = self._events
-        self._events = []
-        yield from events
+        if events is None:
+            return
+        while events:
+            yield events.popleft()
 
     @public
     def log_event(self, event: UserEvent) -> None:
@@ -428,18 +591,21 @@ class OpExecutionContext(AbstractComputeExecutionContext):
             def log_materialization(context):
                 context.log_event(AssetMaterialization("foo"))
         """
-        if isinstance(event, AssetMaterialization):
-            self._events.append(
-                DagsterEvent.asset_materialization(self._step_execution_context, event)
-            )
-        elif isinstance(event, AssetObservation):
-            self._events.append(DagsterEvent.asset_observation(self._step_execution_context, event))
-        elif isinstance(event, ExpectationResult):
-            self._events.append(
-                DagsterEvent.step_expectation_result(self._step_execution_context, event)
+        factory = _USER_EVENT_FACTORIES.get(type(event))
+        if factory is None:
+            factory = next(
+                (
+                    candidate
+                    for event_type, candidate in _USER_EVENT_FACTORIES.items()
+                    if isinstance(event, event_type)
+                ),
+                None,
             )
-        else:
+        if factory is None:
             check.failed(f"Unexpected event {event}")
+        if self._events is None:
+            self._events = deque()
+        self._events.append(factory(self._step_execution_context, event))
 
     @public
     def add_output_metadata(
@@ -479,9 +645,10 @@ class OpExecutionContext(AbstractComputeExecutionContext):
                 return ("dog", 5)
 
         """
-        metadata = check.mapping_param(metadata, "metadata", key_type=str)
-        output_name = check.opt_str_param(output_name, "output_name")
-        mapping_key = check.opt_str_param(mapping_key, "mapping_key")
+        if _PERFORM_PARAM_CHECKS:
+            metadata = check.mapping_param(metadata, "metadata", key_type=str)
+            output_name = check.opt_str_param(output_name, "output_name")
+            mapping_key = check.opt_str_param(mapping_key, "mapping_key")
 
         self._step_execution_context.add_output_metadata(
             metadata=metadata, output_name=output_name, mapping_key=mapping_key
@@ -512,7 +679,11 @@ class OpExecutionContext(AbstractComputeExecutionContext):
         return self._step_execution_context.previous_attempt_count
 
     def describe_op(self) -> str:
-        return self._step_execution_context.describe_op()
+        # cached; the description is immutable for the lifetime of the context and this is
+        # called from error and log formatting paths
+        if self._op_description is None:
+            self._op_description = self._step_execution_context.describe_op()
+        return self._op_description
 
     @public
     def get_mapping_key(self) -> Optional[str]:
@@ -527,53 +698,52 @@ class OpExecutionContext(AbstractComputeExecutionContext):
     @property
     def asset_key(self) -> AssetKey:
         """The AssetKey for the current asset. In a multi_asset, use asset_key_for_output instead."""
-        if self.has_assets_def and len(self.assets_def.keys_by_output_name.keys()) > 1:
+        keys_by_output_name = self.assets_def.keys_by_output_name
+        if len(keys_by_output_name) > 1:
             raise DagsterInvariantViolationError(
                 "Cannot call `context.asset_key` in a multi_asset with more than one asset. Use"
                 " `context.asset_key_for_output` instead."
             )
-        return next(iter(self.assets_def.keys_by_output_name.values()))
+        return next(iter(keys_by_output_name.values()))
 
     @public
     @property
     def has_assets_def(self) -> bool:
         """If there is a backing AssetsDefinition for what is currently executing."""
-        assets_def = self.job_def.asset_layer.assets_def_for_node(self.node_handle)
-        return assets_def is not None
+        return self._assets_def is not None
 
     @public
     @property
     def assets_def(self) -> AssetsDefinition:
         """The backing AssetsDefinition for what is currently executing, errors if not available."""
-        assets_def = self.job_def.asset_layer.assets_def_for_node(self.node_handle)
-        if assets_def is None:
+        if self._assets_def is None:
             raise DagsterInvalidPropertyError(
                 f"Op '{self.op.name}' does not have an assets definition."
             )
-        return assets_def
+        return self._assets_def
 
     @public
     @property
     def selected_asset_keys(self) -> AbstractSet[AssetKey]:
         """Get the set of AssetKeys this execution is expected to materialize."""
-        if not self.has_assets_def:
-            return set()
-        return self.assets_def.keys
+        if self._assets_def is None:
+            return _EMPTY_ASSET_KEYS
+        return self._assets_def.keys
 
     @property
     def is_subset(self):
         """Whether the current AssetsDefinition is subsetted. Note that this can be True inside a
         a graph asset for an op that's not subsetted, if the graph asset is subsetted elsewhere.
         """
-        if not self.has_assets_def:
+        if self._assets_def is None:
             return False
-        return self.assets_def.is_subset
+        return self._assets_def.is_subset
 
     @public
     @property
     def selected_asset_check_keys(self) -> AbstractSet[AssetCheckKey]:
         """Get the asset check keys that correspond to the current selection of assets this execution is expected to materialize."""
-        return self.assets_def.check_keys if self.has_assets_def else set()
+        return self._assets_def.check_keys if self._assets_def is not None else _EMPTY_CHECK_KEYS
 
     @public
     @property
@@ -582,9 +752,10 @@ class OpExecutionContext(AbstractComputeExecutionContext):
         return self._step_execution_context.selected_output_names
 
     @public
+    @cached_method
     def asset_key_for_output(self, output_name: str = "result") -> AssetKey:
         """Return the AssetKey for the corresponding output."""
-        asset_key = self.job_def.asset_layer.asset_key_for_output(
+        asset_key = self._asset_layer.asset_key_for_output(
             node_handle=self.op_handle, output_name=output_name
         )
         if asset_key is None:
@@ -595,16 +766,17 @@ class OpExecutionContext(AbstractComputeExecutionContext):
     @public
     def output_for_asset_key(self, asset_key: AssetKey) -> str:
         """Return the output name for the corresponding asset key."""
-        node_output_handle = self.job_def.asset_layer.node_output_handle_for_asset(asset_key)
+        node_output_handle = self._asset_layer.node_output_handle_for_asset(asset_key)
         if node_output_handle is None:
             check.failed(f"Asset key '{asset_key}' has no output")
         else:
             return node_output_handle.output_name
 
     @public
+    @cached_method
     def asset_key_for_input(self, input_name: str) -> AssetKey:
         """Return the AssetKey for the corresponding input."""
-        key = self.job_def.asset_layer.asset_key_for_input(
+        key = self._asset_layer.asset_key_for_input(
             node_handle=self.op_handle, input_name=input_name
         )
         if key is None:
@@ -748,6 +920,7 @@ class OpExecutionContext(AbstractComputeExecutionContext):
 
     @deprecated(breaking_version="2.0", additional_warn_text="Use `partition_key_range` instead.")
     @public
+    @cached_method
     def asset_partition_key_range_for_output(
         self, output_name: str = "result"
     ) -> PartitionKeyRange:
@@ -811,6 +984,7 @@ class OpExecutionContext(AbstractComputeExecutionContext):
         return self._step_execution_context.asset_partition_key_range_for_output(output_name)
 
     @public
+    @cached_method
     def asset_partition_key_range_for_input(self, input_name: str) -> PartitionKeyRange:
         """Return the PartitionKeyRange for the corresponding input. Errors if the asset depends on a
         non-contiguous chunk of the input.
@@ -874,6 +1048,7 @@ class OpExecutionContext(AbstractComputeExecutionContext):
         return self._step_execution_context.asset_partition_key_range_for_input(input_name)
 
     @public
+    @cached_method
     def asset_partition_key_for_input(self, input_name: str) -> str:
         """Returns the partition key of the upstream asset corresponding to the given input.
 
@@ -917,6 +1092,7 @@ class OpExecutionContext(AbstractComputeExecutionContext):
         return self._step_execution_context.asset_partition_key_for_input(input_name)
 
     @public
+    @cached_method
     def asset_partitions_def_for_output(self, output_name: str = "result") -> PartitionsDefinition:
         """The PartitionsDefinition on the asset corresponding to this output.
 
@@ -957,16 +1133,10 @@ class OpExecutionContext(AbstractComputeExecutionContext):
 
         """
         asset_key = self.asset_key_for_output(output_name)
-        result = self._step_execution_context.job_def.asset_layer.get(asset_key).partitions_def
-        if result is None:
-            raise DagsterInvariantViolationError(
-                f"Attempting to access partitions def for asset {asset_key}, but it is not"
-                " partitioned"
-            )
-
-        return result
+        return _require_partitions_def(asset_key, self._asset_layer.get(asset_key).partitions_def)
 
     @public
+    @cached_method
     def asset_partitions_def_for_input(self, input_name: str) -> PartitionsDefinition:
         """The PartitionsDefinition on the upstream asset corresponding to this input.
 
@@ -995,14 +1165,7 @@ class OpExecutionContext(AbstractComputeExecutionContext):
 
         """
         asset_key = self.asset_key_for_input(input_name)
-        result = self._step_execution_context.job_def.asset_layer.get(asset_key).partitions_def
-        if result is None:
-            raise DagsterInvariantViolationError(
-                f"Attempting to access partitions def for asset {asset_key}, but it is not"
-                " partitioned"
-            )
-
-        return result
+        return _require_partitions_def(asset_key, self._asset_layer.get(asset_key).partitions_def)
 
     @deprecated(breaking_version="2.0", additional_warn_text="Use `partition_keys` instead.")
     @public
@@ -1063,10 +1226,15 @@ class OpExecutionContext(AbstractComputeExecutionContext):
                 # running a backfill of the 2023-08-21 through 2023-08-25 partitions of this asset will log:
                 #   ["2023-08-21", "2023-08-22", "2023-08-23", "2023-08-24", "2023-08-25"]
         """
-        return self.asset_partitions_def_for_output(output_name).get_partition_keys_in_range(
-            self._step_execution_context.asset_partition_key_range_for_output(output_name),
-            dynamic_partitions_store=self.instance,
-        )
+        return [
+            _intern_partition_key(key)
+            for key in self.asset_partitions_def_for_output(
+                output_name
+            ).get_partition_keys_in_range(
+                self._step_execution_context.asset_partition_key_range_for_output(output_name),
+                dynamic_partitions_store=self._get_dynamic_partitions_loader(),
+            )
+        ]
 
     @public
     def asset_partition_keys_for_input(self, input_name: str) -> Sequence[str]:
@@ -1127,10 +1295,8 @@ class OpExecutionContext(AbstractComputeExecutionContext):
                 # running a backfill of the 2023-08-21 through 2023-08-25 partitions of this asset will log:
                 #   ["2023-08-20", "2023-08-21", "2023-08-22", "2023-08-23", "2023-08-24"]
         """
-        return list(
-            self._step_execution_context.asset_partitions_subset_for_input(
-                input_name
-            ).get_partition_keys()
+        return _LazyPartitionKeySequence(
+            self._step_execution_context.asset_partitions_subset_for_input(input_name)
         )
 
     @public
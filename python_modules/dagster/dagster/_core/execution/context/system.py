@@ -817,7 +817,7 @@ class StepExecutionContext(PlanExecutionContext, IStepContext):
         """Whether this step corresponds to an op within a graph (either @graph, or @graph_asset)."""
         return self.step.node_handle.parent is not None
 
-    @property
+    @cached_property
     def is_sda_step(self) -> bool:
         """Whether this step corresponds to a software define asset, inferred by presence of asset info on outputs.
 
@@ -825,7 +825,7 @@ class StepExecutionContext(PlanExecutionContext, IStepContext):
         """
         return is_step_in_asset_graph_layer(self.step, self.job_def)
 
-    @property
+    @cached_property
     def is_in_graph_asset(self) -> bool:
         """If the step is an op in a graph-backed asset returns True. Checks by first confirming the
         step is in a graph, then checking that the node corresponds to an AssetsDefinitions in the asset layer.
@@ -836,7 +836,7 @@ class StepExecutionContext(PlanExecutionContext, IStepContext):
             is not None
         )
 
-    @property
+    @cached_property
     def is_asset_check_step(self) -> bool:
         """Whether this step corresponds to at least one asset check."""
         return any(
@@ -1239,22 +1239,26 @@ class StepExecutionContext(PlanExecutionContext, IStepContext):
             return False
         return asset_layer.get(asset_key).is_observable
 
-    @property
+    @cached_property
     def selected_output_names(self) -> AbstractSet[str]:
         """Get the output names that correspond to the current selection of assets this execution is expected to materialize."""
-        # map selected asset keys to the output names they correspond to
-        assets_def = self.job_def.asset_layer.assets_def_for_node(self.node_handle)
+        # map selected asset keys to the output names they correspond to. cached because the
+        # selection cannot change mid-step and this scan is consulted per output event
+        asset_layer = self.job_def.asset_layer
+        node_handle = self.node_handle
+        assets_def = asset_layer.assets_def_for_node(node_handle)
         if assets_def is not None:
             computation = check.not_none(assets_def.computation)
+            # a single C-level disjointness test per output replaces the per-key Python
+            # membership loop
+            selected_keys = set(computation.selected_asset_keys) | set(
+                computation.selected_asset_check_keys
+            )
 
             selected_outputs: Set[str] = set()
             for output_name in self.op.output_dict.keys():
-                if any(
-                    downstream_asset_key in computation.selected_asset_keys
-                    or downstream_asset_key in computation.selected_asset_check_keys
-                    for downstream_asset_key in self.job_def.asset_layer.downstream_dep_assets_and_checks(
-                        self.node_handle, output_name
-                    )
+                if not selected_keys.isdisjoint(
+                    asset_layer.downstream_dep_assets_and_checks(node_handle, output_name)
                 ):
                     selected_outputs.add(output_name)
 
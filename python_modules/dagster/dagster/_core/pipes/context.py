@@ -42,7 +42,11 @@ from dagster import DagsterEvent
 from dagster._annotations import public
 from dagster._core.definitions.asset_check_result import AssetCheckResult
 from dagster._core.definitions.asset_check_spec import AssetCheckSeverity
-from dagster._core.definitions.data_version import DataProvenance, DataVersion
+from dagster._core.definitions.data_version import (
+    DataProvenance,
+    DataVersion,
+    extract_data_provenance_from_entry,
+)
 from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.metadata import MetadataValue, normalize_metadata_value
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
@@ -499,27 +503,34 @@ def build_external_execution_context_data(
     context: Union[OpExecutionContext, AssetExecutionContext],
     extras: Optional[PipesExtras],
 ) -> "PipesContextData":
+    selected_asset_keys = context.selected_asset_keys if context.has_assets_def else None
     asset_keys = (
-        [_convert_asset_key(key) for key in sorted(context.selected_asset_keys)]
-        if context.has_assets_def
+        [_convert_asset_key(key) for key in sorted(selected_asset_keys)]
+        if selected_asset_keys is not None
         else None
     )
-    code_version_by_asset_key = (
-        {
-            _convert_asset_key(key): context.assets_def.code_versions_by_key[key]
-            for key in context.selected_asset_keys
+    if selected_asset_keys is not None:
+        code_versions_by_key = context.assets_def.code_versions_by_key
+        code_version_by_asset_key = {
+            _convert_asset_key(key): code_versions_by_key[key] for key in selected_asset_keys
         }
-        if context.has_assets_def
-        else None
-    )
-    provenance_by_asset_key = (
-        {
-            _convert_asset_key(key): _convert_data_provenance(context.get_asset_provenance(key))
-            for key in context.selected_asset_keys
+        # fetch the latest materializations for all selected assets in one storage call;
+        # only assets with no materialization fall back to the per-key provenance lookup
+        # (which also considers observation records)
+        latest_materializations = context.instance.get_latest_materialization_events(
+            selected_asset_keys
+        )
+        provenance_by_asset_key = {
+            _convert_asset_key(key): _convert_data_provenance(
+                extract_data_provenance_from_entry(entry)
+                if (entry := latest_materializations.get(key)) is not None
+                else context.get_asset_provenance(key)
+            )
+            for key in selected_asset_keys
         }
-        if context.has_assets_def
-        else None
-    )
+    else:
+        code_version_by_asset_key = None
+        provenance_by_asset_key = None
     partition_key = context.partition_key if context.has_partition_key else None
     partition_key_range = context.partition_key_range if context.has_partition_key else None
     partition_time_window = (
@@ -731,7 +731,10 @@ T_Dataclass = TypeVar("T_Dataclass", bound="DataclassInstance", default="Datacla
 
 class DataclassSerializer(ObjectSerializer[T_Dataclass]):
     def object_as_mapping(self, value: T_Dataclass) -> Mapping[str, Any]:
-        return value.__dict__
+        # restrict to declared fields so that non-field instance state (e.g. cached_property
+        # values) never leaks into the serialized representation
+        value_dict = value.__dict__
+        return {name: value_dict[name] for name in self.constructor_param_names}
 
     @cached_property
     def constructor_param_names(self) -> Sequence[str]:
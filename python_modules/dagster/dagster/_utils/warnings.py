@@ -78,6 +78,24 @@ def normalize_renamed_param(
         return new_val
 
 
+def format_deprecation_warning_message(
+    subject: str, breaking_version: str, additional_warn_text: Optional[str] = None
+) -> str:
+    return f"{subject} is deprecated and will be removed in {breaking_version}." + (
+        (" " + additional_warn_text) if additional_warn_text else ""
+    )
+
+
+def emit_preformatted_deprecation_warning(message: str, stacklevel: int = 3) -> None:
+    """Emit a deprecation warning whose message was formatted ahead of time; used by decorators
+    that fire the same warning on every call and precompute the message at decoration time.
+    """
+    if not _warnings_on.get():
+        return
+
+    warnings.warn(message, category=DeprecationWarning, stacklevel=stacklevel)
+
+
 def deprecation_warning(
     subject: str,
     breaking_version: str,
@@ -88,8 +106,7 @@ def deprecation_warning(
         return
 
     warnings.warn(
-        f"{subject} is deprecated and will be removed in {breaking_version}."
-        + ((" " + additional_warn_text) if additional_warn_text else ""),
+        format_deprecation_warning_message(subject, breaking_version, additional_warn_text),
         category=DeprecationWarning,
         stacklevel=stacklevel,
     )
@@ -449,6 +449,36 @@ def test_multipartitions_def_partition_mapping_infer_identity():
     ).success
 
 
+def test_multipartitions_def_partition_keys_for_input_and_output():
+    composite = MultiPartitionsDefinition(
+        {
+            "abc": StaticPartitionsDefinition(["a", "b", "c"]),
+            "123": StaticPartitionsDefinition(["1", "2", "3"]),
+        }
+    )
+    partition_key = MultiPartitionKey({"abc": "a", "123": "1"})
+
+    @asset(partitions_def=composite)
+    def upstream(context):
+        return 1
+
+    @asset(partitions_def=composite)
+    def downstream(context: AssetExecutionContext, upstream):
+        output_keys = context.op_execution_context.asset_partition_keys_for_output()
+        input_keys = context.asset_partition_keys_for_input("upstream")
+        assert output_keys == [partition_key]
+        assert len(input_keys) == 1 and input_keys[0] == partition_key
+        # the keys must remain MultiPartitionKeys; callers rely on keys_by_dimension
+        assert output_keys[0].keys_by_dimension == {"abc": "a", "123": "1"}
+        assert input_keys[0].keys_by_dimension == {"abc": "a", "123": "1"}
+        return 1
+
+    asset_graph = AssetGraph.from_assets([upstream, downstream])
+    assets_job = define_asset_job("foo", [upstream, downstream]).resolve(asset_graph=asset_graph)
+
+    assert assets_job.execute_in_process(partition_key=partition_key).success
+
+
 def test_multipartitions_def_partition_mapping_infer_single_dim_to_multi():
     abc_def = StaticPartitionsDefinition(["a", "b", "c"])
 
@@ -28,7 +28,7 @@ from dagster_airflow.utils import is_airflow_2_loaded_in_environment
 def make_dagster_definitions_from_airflow_dag_bag(
     dag_bag: DagBag,
     connections: Optional[List[Connection]] = None,
-    resource_defs: Optional[Mapping[str, ResourceDefinition]] = {},
+    resource_defs: Optional[Mapping[str, ResourceDefinition]] = None,
 ) -> Definitions:
     """Construct a Dagster definition corresponding to Airflow DAGs in DagBag.
 
@@ -74,7 +74,7 @@ def make_dagster_definitions_from_airflow_dags_path(
     dag_path: str,
     safe_mode: bool = True,
     connections: Optional[List[Connection]] = None,
-    resource_defs: Optional[Mapping[str, ResourceDefinition]] = {},
+    resource_defs: Optional[Mapping[str, ResourceDefinition]] = None,
 ) -> Definitions:
     """Construct a Dagster repository corresponding to Airflow DAGs in dag_path.
 
@@ -143,7 +143,7 @@ def make_dagster_definitions_from_airflow_dags_path(
 
 
 def make_dagster_definitions_from_airflow_example_dags(
-    resource_defs: Optional[Mapping[str, ResourceDefinition]] = {},
+    resource_defs: Optional[Mapping[str, ResourceDefinition]] = None,
 ) -> Definitions:
     """Construct a Dagster repository for Airflow's example DAGs.
 
@@ -182,7 +182,7 @@ def make_dagster_definitions_from_airflow_example_dags(
 def make_schedules_and_jobs_from_airflow_dag_bag(
     dag_bag: DagBag,
     connections: Optional[List[Connection]] = None,
-    resource_defs: Optional[Mapping[str, ResourceDefinition]] = {},
+    resource_defs: Optional[Mapping[str, ResourceDefinition]] = None,
 ) -> Tuple[List[ScheduleDefinition], List[JobDefinition]]:
     """Construct Dagster Schedules and Jobs corresponding to Airflow DagBag.
 
@@ -197,6 +197,15 @@ def make_schedules_and_jobs_from_airflow_dag_bag(
     check.inst_param(dag_bag, "dag_bag", DagBag)
     connections = check.opt_list_param(connections, "connections", of_type=Connection)
 
+    # build the shared ephemeral airflow_db resource once up front; otherwise the job
+    # factory re-serializes the connection list and rebuilds the resource definition for
+    # every DAG in the bag
+    if not resource_defs or "airflow_db" not in resource_defs:
+        resource_defs = {
+            **(resource_defs or {}),
+            "airflow_db": make_ephemeral_airflow_db_resource(connections=connections),
+        }
+
     job_defs = []
     schedule_defs = []
     count = 0
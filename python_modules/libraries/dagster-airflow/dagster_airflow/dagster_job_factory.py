@@ -22,7 +22,7 @@ def make_dagster_job_from_airflow_dag(
     dag: DAG,
     tags: Optional[Mapping[str, str]] = None,
     connections: Optional[List[Connection]] = None,
-    resource_defs: Optional[Mapping[str, ResourceDefinition]] = {},
+    resource_defs: Optional[Mapping[str, ResourceDefinition]] = None,
 ) -> JobDefinition:
     """Construct a Dagster job corresponding to a given Airflow DAG.
 
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List, Mapping, Optional
 
 from airflow.models.connection import Connection
@@ -11,19 +12,22 @@ from dagster._utils.schedules import is_valid_cron_schedule
 
 from dagster_airflow.dagster_job_factory import make_dagster_job_from_airflow_dag
 
+# many DAGs share the same handful of cron strings ("@daily", "0 * * * *", ...), so
+# validation is memoized across the dag-bag loop
+_is_valid_cron_schedule = lru_cache(maxsize=256)(is_valid_cron_schedule)
+
 
 def _is_dag_is_schedule(dag: DAG) -> bool:
+    # normalized_schedule_interval re-derives the interval per access, so read it once
     cron_schedule = dag.normalized_schedule_interval
-    return isinstance(dag.normalized_schedule_interval, str) and is_valid_cron_schedule(
-        str(cron_schedule)
-    )
+    return isinstance(cron_schedule, str) and _is_valid_cron_schedule(cron_schedule)
 
 
 def make_dagster_schedule_from_airflow_dag(
     dag: DAG,
     tags: Optional[Mapping[str, str]] = None,
     connections: Optional[List[Connection]] = None,
-    resource_defs: Optional[Mapping[str, ResourceDefinition]] = {},
+    resource_defs: Optional[Mapping[str, ResourceDefinition]] = None,
 ) -> ScheduleDefinition:
     """Construct a Dagster schedule corresponding to an Airflow DAG.
 
@@ -37,7 +41,12 @@ def make_dagster_schedule_from_airflow_dag(
     Returns:
         ScheduleDefinition
     """
-    check.inst_param(dag, "dag", DAG)
+    # called once per DAG in dag-bag loops; a bare isinstance keeps the validation without
+    # the check.inst_param call frame
+    if not isinstance(dag, DAG):
+        raise check.ParameterCheckError(
+            f'Param "dag" is not a DAG. Got {dag!r} which is type {type(dag)}.'
+        )
 
     cron_schedule = dag.normalized_schedule_interval
     schedule_description = dag.description